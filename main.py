@@ -1,5 +1,6 @@
 import argparse
 import logging
+from sensor_analysis import config
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -13,6 +14,79 @@ def main():
     parser.add_argument("log_file", help="Path to the sensor log file")
     # Optional argument for the output file path
     parser.add_argument("--output", help="Optional output file for results")
+    # Optional arguments for periodic checkpoints and resuming an interrupted run
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        metavar="N",
+        help="Save a checkpoint every N sensors (requires --output)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the last checkpoint of a previous run with the same --output",
+    )
+    # Optional arguments for collecting malformed lines instead of aborting
+    parser.add_argument(
+        "--quarantine",
+        metavar="FILE",
+        help="Write malformed lines to FILE and keep going instead of aborting",
+    )
+    parser.add_argument(
+        "--quarantine-mode",
+        choices=["line", "block"],
+        default="line",
+        help="Quarantine only the bad line or the whole sensor block containing it",
+    )
+    # Optional arguments for rolling-window drift detection
+    parser.add_argument(
+        "--drift",
+        metavar="FILE",
+        help="Write drift events (first timestamp a sensor leaves the allowed band) to FILE",
+    )
+    parser.add_argument(
+        "--drift-window",
+        type=int,
+        metavar="N",
+        help="Number of readings in the rolling drift window (default: 10)",
+    )
+    # Optional arguments for running read/evaluate/write as concurrent stages
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Read, evaluate and write in concurrent stages and report per-stage timings",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        metavar="BYTES",
+        help="Bytes per block read in pipelined mode (default: 1 MiB)",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        metavar="N",
+        help="Batches buffered between pipeline stages (default: 8)",
+    )
+    # Optional arguments for a fast sampled preview instead of a full run
+    parser.add_argument(
+        "--sample",
+        type=int,
+        nargs="?",
+        const=config.SAMPLE_SIZE,
+        metavar="N",
+        help=f"Estimate the status distribution from N randomly sampled sensors "
+        f"(default: {config.SAMPLE_SIZE}) instead of analyzing the whole log",
+    )
+    parser.add_argument(
+        "--sample-margin",
+        type=float,
+        metavar="M",
+        help="Stop sampling once every confidence interval is within +/- M",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="Random seed for a reproducible sampled preview"
+    )
     # Parse command-line arguments
     args = parser.parse_args()
 
@@ -22,8 +96,32 @@ def main():
 
         # Initialize the service with the provided log file
         service = SensorAnalysisService(args.log_file)
+        if args.sample is not None:
+            # Only preview a random sample of sensors
+            service.preview(
+                output_file=args.output,
+                sample_size=args.sample,
+                margin=args.sample_margin,
+                seed=args.seed,
+            )
+            return
         # Run the analysis and write results to the specified output file (or stdout if not provided)
-        service.run(output_file=args.output)
+        service.run(
+            output_file=args.output,
+            checkpoint_every=args.checkpoint_every,
+            resume=args.resume,
+            quarantine_file=args.quarantine,
+            quarantine_mode=args.quarantine_mode,
+            drift_file=args.drift,
+            drift_window=args.drift_window,
+            pipelined=args.pipeline,
+            block_size=args.block_size,
+            queue_depth=args.queue_depth,
+        )
+        if args.pipeline:
+            # Show which pipeline stage was the bottleneck
+            for stats in service.stage_stats.values():
+                logger.warning(f"Pipeline stage {stats}")
     except FileNotFoundError:
         # Log an error if the log file does not exist
         logger.error(f"Log file {args.log_file} not found")
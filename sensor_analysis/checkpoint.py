@@ -0,0 +1,162 @@
+import json
+import logging
+import os
+from typing import Optional, TextIO
+from . import config
+from .parser import LogParser
+from .drift import DriftDetector
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+
+# Class to represent the progress of an analysis at a sensor boundary
+class Checkpoint:
+    def __init__(
+        self,
+        log_size: int,
+        byte_offset: int,
+        line_num: int,
+        output_offset: int,
+        quarantine_offset: int,
+        results_written: int,
+        drift_offset: int = 0,
+        log_mtime: Optional[int] = None,
+    ):
+        # Size and modification time (ns) of the log when the checkpoint was taken,
+        # to detect a changed input
+        self.log_size = log_size
+        self.log_mtime = log_mtime
+        # Position of the next sensor header to parse
+        self.byte_offset = byte_offset
+        self.line_num = line_num
+        # Size of the intermediate results, quarantine and drift files at that point
+        self.output_offset = output_offset
+        self.quarantine_offset = quarantine_offset
+        self.drift_offset = drift_offset
+        self.results_written = results_written
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Checkpoint":
+        return cls(**data)
+
+
+# Class to periodically save analysis progress and restore it on --resume
+class CheckpointManager:
+    def __init__(
+        self,
+        log_file: str,
+        output_file: str,
+        every: int = config.CHECKPOINT_EVERY_SENSORS,
+    ):
+        if every <= 0:
+            raise ValueError("Checkpoint interval must be a positive number of sensors")
+        self.log_file = log_file
+        self.checkpoint_file = output_file + ".ckpt"
+        # Intermediate results are kept next to the output so they survive a crash
+        self.partial_file = output_file + ".partial"
+        self.every = every
+        self.parser: Optional[LogParser] = None
+        self.drift: Optional[DriftDetector] = None
+        self.resumed: Optional[Checkpoint] = None
+        self.results_written = 0
+        self._since_last = 0
+
+    def load(self) -> Optional[Checkpoint]:
+        """Loads the last saved checkpoint, or returns None if there is none."""
+        if not os.path.exists(self.checkpoint_file):
+            logger.warning(
+                f"No checkpoint found at {self.checkpoint_file}, starting from the beginning"
+            )
+            return None
+        with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+            checkpoint = Checkpoint.from_dict(json.load(f))
+        if self._log_fingerprint() != (checkpoint.log_size, checkpoint.log_mtime):
+            raise ValueError(
+                f"Log file {self.log_file} changed since the checkpoint was taken"
+            )
+        if not os.path.exists(self.partial_file):
+            raise ValueError(f"Intermediate results {self.partial_file} are missing")
+        # Side files shorter than recorded belong to another run and cannot be resumed
+        side_files = [(self.partial_file, checkpoint.output_offset)]
+        if self.parser is not None and self.parser.quarantine is not None:
+            side_files.append(
+                (self.parser.quarantine.quarantine_file, checkpoint.quarantine_offset)
+            )
+        if self.drift is not None:
+            side_files.append((self.drift.drift_file, checkpoint.drift_offset))
+        for path, offset in side_files:
+            if os.path.exists(path) and os.path.getsize(path) < offset:
+                raise ValueError(
+                    f"{path} is shorter than recorded in the checkpoint, cannot resume"
+                )
+        logger.info(
+            f"Resuming from line {checkpoint.line_num} after {checkpoint.results_written} sensors"
+        )
+        self.resumed = checkpoint
+        self.results_written = checkpoint.results_written
+        return checkpoint
+
+    def attach(self, parser: LogParser, drift: Optional[DriftDetector] = None):
+        """Registers the stages whose positions are recorded in each checkpoint."""
+        self.parser = parser
+        parser.track_positions = True
+        self.drift = drift
+
+    def _log_fingerprint(self):
+        stat = os.stat(self.log_file)
+        return stat.st_size, stat.st_mtime_ns
+
+    def open_partial(self) -> TextIO:
+        """Opens the intermediate results file, dropping anything past the checkpoint."""
+        if self.resumed is None:
+            return open(self.partial_file, "w", encoding="utf-8")
+        os.truncate(self.partial_file, self.resumed.output_offset)
+        return open(self.partial_file, "a", encoding="utf-8")
+
+    def on_result(self, output: TextIO):
+        """Called after each result is written; saves a checkpoint every N sensors."""
+        self.results_written += 1
+        self._since_last += 1
+        if self._since_last >= self.every:
+            self.save(output)
+
+    def save(self, output: TextIO):
+        byte_offset, line_num, quarantine_offset = self.parser.resume_point
+        # Make sure everything the checkpoint refers to is on disk first
+        output.flush()
+        os.fsync(output.fileno())
+        if self.parser.quarantine is not None:
+            self.parser.quarantine.flush()
+        if self.drift is not None:
+            self.drift.flush()
+
+        log_size, log_mtime = self._log_fingerprint()
+        checkpoint = Checkpoint(
+            log_size=log_size,
+            log_mtime=log_mtime,
+            byte_offset=byte_offset,
+            line_num=line_num,
+            output_offset=output.tell(),
+            quarantine_offset=quarantine_offset,
+            results_written=self.results_written,
+            drift_offset=self.drift.resume_size if self.drift else 0,
+        )
+        # Write atomically so a crash never leaves a half-written checkpoint
+        temp_file = self.checkpoint_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(checkpoint.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.checkpoint_file)
+        self._since_last = 0
+        logger.debug(f"Checkpoint saved at line {line_num}")
+
+    def clear(self):
+        """Removes the checkpoint and intermediate results of a finished or stale run."""
+        for path in (self.checkpoint_file, self.partial_file):
+            if os.path.exists(path):
+                os.remove(path)
@@ -6,3 +6,20 @@ TEMPERATURE_ALLOWED_MEAN_DIFF = 0.5
 
 HUMIDITY_ALLOWED_DIFF = 1.0
 MONOXIDE_ALLOWED_DIFF = 3.0
+
+# Number of evaluated sensors between two checkpoints
+CHECKPOINT_EVERY_SENSORS = 100000
+
+# Number of readings in the rolling window used for drift detection
+DRIFT_WINDOW_SIZE = 10
+
+# Pipelined mode: bytes per block read, batches held per queue and results per batch
+PIPELINE_BLOCK_SIZE = 1024 * 1024
+PIPELINE_QUEUE_DEPTH = 8
+PIPELINE_BATCH_SIZE = 1000
+
+# Sampled preview: sensors to sample, confidence level of the reported intervals,
+# and minimum samples per sensor type before the margin can stop sampling
+SAMPLE_SIZE = 2000
+SAMPLE_CONFIDENCE = 0.95
+SAMPLE_MIN_PER_TYPE = 30
@@ -0,0 +1,147 @@
+import json
+import logging
+import math
+import os
+from collections import deque
+from typing import Iterator, Optional
+from . import config
+from .parser import SensorRecord
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+
+# Streaming stage that reports when each sensor starts drifting from the reference
+class DriftDetector:
+    def __init__(
+        self,
+        drift_file: str,
+        known_temperature: float,
+        known_humidity: float,
+        known_monoxide: float,
+        window_size: int = config.DRIFT_WINDOW_SIZE,
+    ):
+        if window_size < 2:
+            raise ValueError("Drift window must hold at least 2 readings")
+        self.drift_file = drift_file
+        self.window_size = window_size
+        # Reference value and allowed deviation of the rolling mean per sensor type
+        self.bands = {
+            "thermometer": (known_temperature, config.TEMPERATURE_ALLOWED_MEAN_DIFF),
+            "humidity": (known_humidity, config.HUMIDITY_ALLOWED_DIFF),
+            "monoxide": (known_monoxide, config.MONOXIDE_ALLOWED_DIFF),
+        }
+        self.size = 0
+        # Size of the drift file before the sensor currently being tracked (for checkpoints)
+        self.resume_size = 0
+        self.count = 0
+        self._file = None
+
+    def open(self, resume_offset: Optional[int] = None):
+        """Opens the drift file, truncating it to resume_offset when resuming a run."""
+        if resume_offset is None or not os.path.exists(self.drift_file):
+            if resume_offset:
+                logger.warning(
+                    f"Drift file {self.drift_file} is missing, earlier events are lost"
+                )
+            self._file = open(self.drift_file, "w", encoding="utf-8")
+            self.size = 0
+        else:
+            os.truncate(self.drift_file, resume_offset)
+            self._file = open(self.drift_file, "a", encoding="utf-8")
+            self.size = resume_offset
+        self.resume_size = self.size
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        logger.info(f"{self.count} drift event(s) written to {self.drift_file}")
+
+    def _emit(self, sensor_name: str, event: str, timestamp: str, value: float):
+        entry = (
+            json.dumps(
+                {
+                    "sensor": sensor_name,
+                    "event": event,
+                    "timestamp": timestamp,
+                    "value": round(value, 3),
+                }
+            )
+            + "\n"
+        )
+        self._file.write(entry)
+        self.size += len(entry.encode("utf-8"))
+        self.count += 1
+
+    def track(self, sensor_records: Iterator[SensorRecord]) -> Iterator[SensorRecord]:
+        """Passes records through unchanged while updating per-sensor rolling windows.
+
+        Rolling sums are updated in constant time per reading. Only the first time a
+        sensor's rolling mean leaves the allowed band, or a thermometer's rolling
+        standard deviation stops being "very precise", is reported.
+        """
+        window_size = self.window_size
+        current_sensor = None
+        window = deque()
+        total = 0.0
+        total_sq = 0.0
+        band = None
+
+        for record in sensor_records:
+            sensor_key = (record.sensor_type, record.sensor_name)
+
+            # Reset the window when a new sensor starts
+            if sensor_key != current_sensor:
+                current_sensor = sensor_key
+                self.resume_size = self.size
+                window.clear()
+                total = 0.0
+                total_sq = 0.0
+                band = self.bands.get(record.sensor_type)
+                check_std = record.sensor_type == "thermometer"
+                mean_reported = False
+                std_reported = False
+
+            if band is not None:
+                value = record.value
+                window.append(value)
+                total += value
+                total_sq += value * value
+                if len(window) > window_size:
+                    oldest = window.popleft()
+                    total -= oldest
+                    total_sq -= oldest * oldest
+
+                if len(window) == window_size:
+                    mean_value = total / window_size
+                    if not mean_reported and abs(mean_value - band[0]) > band[1]:
+                        self._emit(
+                            record.sensor_name,
+                            "mean out of band",
+                            record.timestamp,
+                            mean_value,
+                        )
+                        mean_reported = True
+                    if check_std and not std_reported:
+                        # Sample variance from the rolling sums, clamped against rounding
+                        variance = max(
+                            (total_sq - total * mean_value) / (window_size - 1), 0.0
+                        )
+                        std_dev = math.sqrt(variance)
+                        if std_dev >= config.TEMPERATURE_VERY_PRECISION_STD_DEV:
+                            self._emit(
+                                record.sensor_name,
+                                "std dev exceeded",
+                                record.timestamp,
+                                std_dev,
+                            )
+                            std_reported = True
+
+            yield record
+
+        self.resume_size = self.size
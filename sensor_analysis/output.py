@@ -3,6 +3,7 @@ import logging
 import tempfile
 import os
 from typing import Optional, Iterator, Dict
+from .checkpoint import CheckpointManager
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -10,17 +11,28 @@ logger = logging.getLogger(__name__)
 # Class to handle writing of sensor evaluation results
 class OutputWriter:
     def write_streaming_results(
-        self, results_iter: Iterator[Dict[str, str]], output_file: Optional[str] = None
+        self,
+        results_iter: Iterator[Dict[str, str]],
+        output_file: Optional[str] = None,
+        checkpoint: Optional[CheckpointManager] = None,
     ):
         if output_file:
-            # Create a temporary file for streaming results
-            temp_fd, temp_file = tempfile.mkstemp()
+            if checkpoint is not None:
+                # Keep intermediate results next to the output so a crashed run can resume
+                temp_file = checkpoint.partial_file
+                partial = checkpoint.open_partial()
+            else:
+                # Create a temporary file for streaming results
+                temp_fd, temp_file = tempfile.mkstemp()
+                partial = open(temp_fd, "w", encoding="utf-8")
             try:
                 # Write each result as a separate line in the temporary file
-                with open(temp_fd, "w", encoding="utf-8") as f:
+                with partial as f:
                     for result in results_iter:
                         json.dump(result, f)
                         f.write("\n")
+                        if checkpoint is not None:
+                            checkpoint.on_result(f)
 
                 # Read the temporary file and consolidate results into a single dictionary
                 final_results = {}
@@ -38,8 +50,12 @@ class OutputWriter:
                 logger.error(f"Failed to write results to {output_file}: {str(e)}")
                 raise
             finally:
-                # Clean up by removing the temporary file
-                os.remove(temp_file)
+                # Clean up by removing the temporary file (checkpointed runs keep it to resume)
+                if checkpoint is None:
+                    os.remove(temp_file)
+
+            if checkpoint is not None:
+                checkpoint.clear()
 
         else:
             # If no output file is specified, print results to stdout
@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime
-from typing import Generator, Tuple
+from typing import Generator, Iterable, Optional, Tuple
+from .quarantine import QuarantineWriter
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -17,10 +18,20 @@ class SensorRecord:
         self.value = value
 
 
+# Sensor types that may start a block of readings in the log
+SENSOR_TYPES = ("thermometer", "humidity", "monoxide")
+
+
 # Class to parse sensor log files
 class LogParser:
-    def __init__(self, log_file: str):
+    def __init__(self, log_file: str, quarantine: Optional[QuarantineWriter] = None):
         self.log_file = log_file
+        self.quarantine = quarantine
+        # Set by CheckpointManager.attach; byte offsets are only tracked when needed
+        self.track_positions = False
+        # Byte offset, line number and quarantine size at the header of the sensor block
+        # whose records are currently being yielded (the end of file once exhausted)
+        self.resume_point = (0, 1, 0)
 
     def parse_reference(self) -> Tuple[float, float, float]:
         """Reads the first line of the log and returns reference values."""
@@ -43,8 +54,25 @@ class LogParser:
             )
             return known_temperature, known_humidity, known_monoxide
 
-    def parse_records(self) -> Generator[SensorRecord, None, None]:
-        """Generator that reads the log file line by line and yields sensor records."""
+    def parse_records(
+        self, start_offset: Optional[int] = None, start_line: Optional[int] = None
+    ) -> Generator[SensorRecord, None, None]:
+        """Returns a generator that reads the log file line by line and yields records.
+
+        Parsing starts right after the reference line, or at start_offset/start_line
+        when resuming from a checkpoint (the offset must point at a sensor header).
+        """
+        if (
+            self.quarantine is None
+            and not self.track_positions
+            and start_offset is None
+        ):
+            # Common case: no byte offsets or bad-line handling needed
+            return self._parse_plain_records()
+        return self._parse_tracked_records(start_offset, start_line)
+
+    def _parse_plain_records(self) -> Generator[SensorRecord, None, None]:
+        """Lean text-mode parser used when neither checkpoints nor quarantine are on."""
         current_sensor_type = None
         current_sensor_name = None
         line_num = 1
@@ -62,11 +90,7 @@ class LogParser:
 
                 parts = line.split()
                 # Check if the line defines a new sensor
-                if len(parts) == 2 and parts[0] in (
-                    "thermometer",
-                    "humidity",
-                    "monoxide",
-                ):
+                if len(parts) == 2 and parts[0] in SENSOR_TYPES:
                     current_sensor_type = parts[0]
                     current_sensor_name = parts[1]
                 # Process a sensor reading if a sensor is defined
@@ -93,3 +117,123 @@ class LogParser:
                 else:
                     raise ValueError(f"Invalid line format at line {line_num}: {line}")
                 line_num += 1
+
+    def _parse_tracked_records(
+        self, start_offset: Optional[int], start_line: Optional[int]
+    ) -> Generator[SensorRecord, None, None]:
+        """Binary-mode parser that tracks byte offsets for checkpoints and quarantine."""
+        with open(self.log_file, "rb") as f:
+            if start_offset is None:
+                # Skip the first line (reference), as it was already processed
+                offset = len(f.readline())
+                line_num = 2
+            else:
+                f.seek(start_offset)
+                offset = start_offset
+                line_num = start_line
+            yield from self.parse_lines(f, offset, line_num)
+
+    def parse_lines(
+        self, raw_lines: Iterable[bytes], offset: int, line_num: int
+    ) -> Generator[SensorRecord, None, None]:
+        """Parses raw log lines (after the reference line) into sensor records.
+
+        offset and line_num describe where the first line starts in the log file.
+        """
+        current_sensor_type = None
+        current_sensor_name = None
+        quarantine = self.quarantine
+        block_mode = quarantine is not None and quarantine.mode == "block"
+        # Buffered state of the current sensor block, used only in block quarantine mode
+        block_start = None
+        block_records = []
+        block_lines = []
+        block_error = None
+
+        for raw_line in raw_lines:
+            # Track byte offsets so checkpoints can seek straight back here
+            line_offset = offset
+            offset += len(raw_line)
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if not line:
+                line_num += 1
+                continue
+
+            parts = line.split()
+            record = None
+            error = None
+            # Check if the line defines a new sensor
+            if len(parts) == 2 and parts[0] in SENSOR_TYPES:
+                if block_mode:
+                    yield from self._flush_block(
+                        block_start, block_records, block_lines, block_error
+                    )
+                    block_records = []
+                    block_lines = []
+                    block_error = None
+                else:
+                    self.resume_point = (
+                        line_offset,
+                        line_num,
+                        quarantine.size if quarantine else 0,
+                    )
+                block_start = (line_offset, line_num)
+                current_sensor_type = parts[0]
+                current_sensor_name = parts[1]
+            # Process a sensor reading if a sensor is defined
+            elif len(parts) == 2 and current_sensor_type:
+                try:
+                    timestamp = parts[0]
+                    # Validate timestamp format
+                    datetime.strptime(timestamp, "%Y-%m-%dT%H:%M")
+                    # Convert value to float for thermometer/humidity, int for monoxide
+                    value = (
+                        float(parts[1])
+                        if current_sensor_type != "monoxide"
+                        else int(parts[1])
+                    )
+                    record = SensorRecord(
+                        sensor_type=current_sensor_type,
+                        sensor_name=current_sensor_name,
+                        timestamp=timestamp,
+                        value=value,
+                    )
+                except ValueError as e:
+                    error = f"Invalid record at line {line_num}: {str(e)}"
+            else:
+                error = f"Invalid line format at line {line_num}: {line}"
+
+            if error is not None:
+                if quarantine is None:
+                    raise ValueError(error)
+                if block_mode and current_sensor_type:
+                    # Keep the first error; the whole block is quarantined on flush
+                    block_error = block_error or error
+                else:
+                    quarantine.write(line_num, line, error)
+
+            if block_mode:
+                if current_sensor_type:
+                    block_lines.append((line_num, line))
+                if record is not None:
+                    block_records.append(record)
+            elif record is not None:
+                yield record
+            line_num += 1
+
+        if block_mode:
+            yield from self._flush_block(
+                block_start, block_records, block_lines, block_error
+            )
+        self.resume_point = (offset, line_num, quarantine.size if quarantine else 0)
+
+    def _flush_block(self, block_start, block_records, block_lines, block_error):
+        """Yields a buffered sensor block, or quarantines it if any line was bad."""
+        if block_start is None:
+            return
+        if block_error is not None:
+            for line_num, line in block_lines:
+                self.quarantine.write(line_num, line, block_error)
+            return
+        self.resume_point = (*block_start, self.quarantine.size)
+        yield from block_records
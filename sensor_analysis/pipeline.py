@@ -0,0 +1,222 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterator, Optional
+from . import config
+from .parser import LogParser, SensorRecord
+from .output import OutputWriter
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Marker put on a queue once the producing stage has finished
+_DONE = object()
+
+
+# Class to accumulate how long a pipeline stage worked and waited
+class StageStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.busy = 0.0
+        self.idle = 0.0
+        self.batches = 0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {"busy": self.busy, "idle": self.idle, "batches": self.batches}
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: busy {self.busy:.2f}s, idle {self.idle:.2f}s, "
+            f"{self.batches} batches"
+        )
+
+
+# Runs reading, parsing/evaluation and writing as concurrent stages
+class AnalysisPipeline:
+    """Hands batches between stages through bounded queues for backpressure.
+
+    A reader thread does large block reads, the calling thread parses and
+    evaluates, and a writer thread serializes results, so disk waits overlap
+    with CPU work. Idle time is time spent waiting on a queue; a stage that is
+    rarely idle is the bottleneck.
+    """
+
+    def __init__(
+        self,
+        block_size: int = config.PIPELINE_BLOCK_SIZE,
+        queue_depth: int = config.PIPELINE_QUEUE_DEPTH,
+        batch_size: int = config.PIPELINE_BATCH_SIZE,
+    ):
+        if block_size <= 0 or queue_depth <= 0 or batch_size <= 0:
+            raise ValueError("Block size, queue depth and batch size must be positive")
+        self.block_size = block_size
+        self.queue_depth = queue_depth
+        self.batch_size = batch_size
+        self.stats = {
+            name: StageStats(name) for name in ("reader", "evaluator", "writer")
+        }
+        self._stop = threading.Event()
+        self._errors = []
+
+    def _put(self, q: queue.Queue, item, stats: StageStats) -> bool:
+        """Puts an item on a queue, giving up if another stage has failed."""
+        start = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        finally:
+            stats.idle += time.perf_counter() - start
+
+    def _get(self, q: queue.Queue, stats: StageStats):
+        """Takes an item from a queue, returning _DONE if another stage has failed."""
+        start = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return _DONE
+        finally:
+            stats.idle += time.perf_counter() - start
+
+    def _run_stage(self, target: Callable, stats: StageStats, *args):
+        """Runs a stage, recording its busy time and any error it raises."""
+        start = time.perf_counter()
+        try:
+            target(*args)
+        except BaseException as e:
+            self._errors.append(e)
+            self._stop.set()
+        finally:
+            stats.busy += time.perf_counter() - start - stats.idle
+
+    def _read_blocks(self, log_file: str, start_offset: int, chunks: queue.Queue):
+        stats = self.stats["reader"]
+        with open(log_file, "rb") as f:
+            f.seek(start_offset)
+            remainder = b""
+            while True:
+                block = f.read(self.block_size)
+                if not block:
+                    break
+                # Only hand over whole lines; keep the tail for the next block
+                block = remainder + block
+                cut = block.rfind(b"\n") + 1
+                remainder = block[cut:]
+                if cut:
+                    stats.batches += 1
+                    if not self._put(chunks, block[:cut], stats):
+                        return
+            if remainder:
+                stats.batches += 1
+                if not self._put(chunks, remainder, stats):
+                    return
+        self._put(chunks, _DONE, stats)
+
+    def _lines(self, chunks: queue.Queue) -> Iterator[bytes]:
+        stats = self.stats["evaluator"]
+        while True:
+            chunk = self._get(chunks, stats)
+            if chunk is _DONE:
+                return
+            yield from chunk.splitlines(keepends=True)
+
+    def _evaluate(
+        self,
+        parser: LogParser,
+        evaluate: Callable[[Iterator[SensorRecord]], Iterator[Dict[str, str]]],
+        start_offset: int,
+        chunks: queue.Queue,
+        batches: queue.Queue,
+    ):
+        stats = self.stats["evaluator"]
+        records = parser.parse_lines(self._lines(chunks), start_offset, 2)
+        batch = []
+        for result in evaluate(records):
+            batch.append(result)
+            if len(batch) >= self.batch_size:
+                stats.batches += 1
+                if not self._put(batches, batch, stats):
+                    return
+                batch = []
+        if self._stop.is_set():
+            # The reader failed, so the results are incomplete
+            return
+        if batch:
+            stats.batches += 1
+            if not self._put(batches, batch, stats):
+                return
+        self._put(batches, _DONE, stats)
+
+    def _results(self, batches: queue.Queue) -> Iterator[Dict[str, str]]:
+        stats = self.stats["writer"]
+        while True:
+            batch = self._get(batches, stats)
+            if batch is _DONE:
+                if self._stop.is_set():
+                    # Do not finalize the output from a failed run
+                    raise RuntimeError("Pipeline stopped before all results arrived")
+                return
+            stats.batches += 1
+            yield from batch
+
+    def run(
+        self,
+        parser: LogParser,
+        evaluate: Callable[[Iterator[SensorRecord]], Iterator[Dict[str, str]]],
+        writer: OutputWriter,
+        output_file: Optional[str] = None,
+    ):
+        """Runs the pipeline; evaluate maps parsed records to evaluation results."""
+        chunks = queue.Queue(maxsize=self.queue_depth)
+        batches = queue.Queue(maxsize=self.queue_depth)
+
+        # Skip the reference line, as it was already processed
+        with open(parser.log_file, "rb") as f:
+            start_offset = len(f.readline())
+
+        reader = threading.Thread(
+            target=self._run_stage,
+            args=(
+                self._read_blocks,
+                self.stats["reader"],
+                parser.log_file,
+                start_offset,
+                chunks,
+            ),
+            name="sensor-reader",
+        )
+        writer_thread = threading.Thread(
+            target=self._run_stage,
+            args=(
+                writer.write_streaming_results,
+                self.stats["writer"],
+                self._results(batches),
+                output_file,
+            ),
+            name="sensor-writer",
+        )
+        reader.start()
+        writer_thread.start()
+        self._run_stage(
+            self._evaluate,
+            self.stats["evaluator"],
+            parser,
+            evaluate,
+            start_offset,
+            chunks,
+            batches,
+        )
+        reader.join()
+        writer_thread.join()
+
+        if self._errors:
+            # Report the first failure; later ones are usually consequences of it
+            raise self._errors[0]
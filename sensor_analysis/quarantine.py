@@ -0,0 +1,56 @@
+import json
+import logging
+import os
+from typing import Optional
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+QUARANTINE_MODES = ("line", "block")
+
+
+# Class to collect malformed log lines in a side file instead of aborting the run
+class QuarantineWriter:
+    def __init__(self, quarantine_file: str, mode: str = "line"):
+        if mode not in QUARANTINE_MODES:
+            raise ValueError(f"Unknown quarantine mode '{mode}'")
+        self.quarantine_file = quarantine_file
+        # "line" drops only the bad line, "block" drops the whole sensor block containing it
+        self.mode = mode
+        self.size = 0
+        self.count = 0
+        self._file = None
+
+    def open(self, resume_offset: Optional[int] = None):
+        """Opens the side file, truncating it to resume_offset when resuming a run."""
+        if resume_offset is None or not os.path.exists(self.quarantine_file):
+            if resume_offset:
+                logger.warning(
+                    f"Quarantine file {self.quarantine_file} is missing, earlier entries are lost"
+                )
+            self._file = open(self.quarantine_file, "w", encoding="utf-8")
+            self.size = 0
+        else:
+            os.truncate(self.quarantine_file, resume_offset)
+            self._file = open(self.quarantine_file, "a", encoding="utf-8")
+            self.size = resume_offset
+
+    def write(self, line_num: int, line: str, error: str):
+        """Writes a single bad line as a JSON object with its line number."""
+        entry = json.dumps({"line": line_num, "text": line, "error": error}) + "\n"
+        self._file.write(entry)
+        self.size += len(entry.encode("utf-8"))
+        self.count += 1
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.count:
+            logger.warning(
+                f"Quarantined {self.count} line(s) to {self.quarantine_file}"
+            )
@@ -0,0 +1,207 @@
+import logging
+import math
+import os
+import random
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+from . import config
+from .parser import LogParser, SENSOR_TYPES
+from .evaluator import SensorEvaluator
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Sensor header keywords as they appear in the raw (binary) log
+_SENSOR_HEADERS = {sensor_type.encode() for sensor_type in SENSOR_TYPES}
+
+# z-score of the two-sided confidence interval
+_Z = NormalDist().inv_cdf((1 + config.SAMPLE_CONFIDENCE) / 2)
+
+
+def wilson_interval(successes: int, total: int, z: float) -> Tuple[float, float]:
+    """Returns the Wilson score interval for a proportion successes/total."""
+    p = successes / total
+    denominator = 1 + z * z / total
+    centre = (p + z * z / (2 * total)) / denominator
+    half_width = (
+        z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    )
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+# Class to estimate the status distribution from randomly sampled sensor blocks
+class SampledPreview:
+    """Seeks to random byte offsets and evaluates the next whole sensor block.
+
+    The block following a random offset is picked with a probability proportional
+    to the size of the block before it (the reference line for the first block),
+    which does not depend on the sampled sensor's own readings, so status
+    proportions within each sensor type are unbiased. The mix of sensor types is
+    not estimated for the same reason.
+    """
+
+    def __init__(
+        self,
+        log_file: str,
+        sample_size: int = config.SAMPLE_SIZE,
+        margin: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        if sample_size <= 0:
+            raise ValueError("Sample size must be positive")
+        self.log_file = log_file
+        self.sample_size = sample_size
+        # Stop early once every confidence interval is within +/- margin
+        self.margin = margin
+        self.random = random.Random(seed)
+
+    def _read_block(
+        self, f, offset: int
+    ) -> Tuple[Optional[int], List[bytes], int, int]:
+        """Resynchronizes on the next sensor header after offset and reads its block.
+
+        Returns the header offset (None at end of file), the block lines, and the
+        byte offsets where reading started and where the block ends.
+        """
+        # Step back one byte so a header starting exactly at offset is not skipped;
+        # offsets inside the reference line resynchronize on the first block
+        start = max(offset - 1, 0)
+        f.seek(start)
+        f.readline()
+        header_offset = None
+        block_lines = []
+        while True:
+            line_offset = f.tell()
+            raw_line = f.readline()
+            if not raw_line:
+                break
+            parts = raw_line.split()
+            if len(parts) == 2 and parts[0] in _SENSOR_HEADERS:
+                if header_offset is not None:
+                    # The next sensor starts, so the sampled block is complete
+                    break
+                header_offset = line_offset
+            if header_offset is not None:
+                block_lines.append(raw_line)
+        return header_offset, block_lines, start, line_offset
+
+    def _margin_reached(self, counts: Dict[str, Dict[str, int]]) -> bool:
+        if self.margin is None or not counts:
+            return False
+        for statuses in counts.values():
+            total = sum(statuses.values())
+            if total < config.SAMPLE_MIN_PER_TYPE:
+                return False
+            for count in statuses.values():
+                low, high = wilson_interval(count, total, _Z)
+                if (high - low) / 2 > self.margin:
+                    return False
+        return True
+
+    def run(self) -> Dict:
+        """Samples sensor blocks and returns the estimated status distribution."""
+        parser = LogParser(self.log_file)
+        known_temperature, known_humidity, known_monoxide = parser.parse_reference()
+        evaluator = SensorEvaluator()
+
+        counts = {}
+        seen = set()
+        sampled = 0
+        skipped = 0
+        # Byte ranges scanned by the probes, merged at the end to count bytes once
+        scanned = []
+        attempts = 0
+        # Give up after this many probes, e.g. when a small log has fewer sensors
+        max_attempts = self.sample_size * 10
+
+        with open(self.log_file, "rb") as f:
+            # The reference line counts as covered; each new block adds its own bytes
+            covered = len(f.readline())
+            file_size = os.fstat(f.fileno()).st_size
+            while (
+                sampled < self.sample_size
+                and attempts < max_attempts
+                # Once every byte belongs to a seen block, every header has been seen
+                and covered < file_size
+            ):
+                attempts += 1
+                offset = self.random.randrange(file_size)
+                header_offset, block_lines, start, end = self._read_block(f, offset)
+                scanned.append((start, end))
+                # Sample without replacement
+                if header_offset is None or header_offset in seen:
+                    continue
+                seen.add(header_offset)
+                covered += end - header_offset
+
+                try:
+                    # Line numbers are unknown here, so errors only mark the block as bad
+                    records = list(parser.parse_lines(block_lines, header_offset, 0))
+                    results = list(
+                        evaluator.evaluate(
+                            known_temperature,
+                            known_humidity,
+                            known_monoxide,
+                            iter(records),
+                        )
+                    )
+                except ValueError as e:
+                    logger.debug(f"Skipping malformed block at byte {header_offset}: {e}")
+                    skipped += 1
+                    continue
+                if not results:
+                    skipped += 1
+                    continue
+
+                sensor_type = records[0].sensor_type
+                status = next(iter(results[0].values()))
+                statuses = counts.setdefault(sensor_type, {})
+                statuses[status] = statuses.get(status, 0) + 1
+                sampled += 1
+
+                if sampled % 50 == 0 and self._margin_reached(counts):
+                    break
+
+        total_read = self._merged_size(scanned)
+        logger.info(
+            f"Sampled {sampled} sensors reading {total_read} of {file_size} bytes"
+        )
+        return {
+            "sensors_sampled": sampled,
+            "blocks_skipped": skipped,
+            "bytes_read": total_read,
+            "fraction_read": round(total_read / file_size, 6) if file_size else 0.0,
+            "confidence": config.SAMPLE_CONFIDENCE,
+            "sensor_types": {
+                sensor_type: self._summarize(statuses)
+                for sensor_type, statuses in counts.items()
+            },
+        }
+
+    @staticmethod
+    def _merged_size(ranges: List[Tuple[int, int]]) -> int:
+        """Returns the number of distinct bytes covered by the given ranges."""
+        total = 0
+        current_start = current_end = None
+        for start, end in sorted(ranges):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+
+    def _summarize(self, statuses: Dict[str, int]) -> Dict:
+        total = sum(statuses.values())
+        summary = {}
+        for status, count in sorted(statuses.items(), key=lambda item: -item[1]):
+            low, high = wilson_interval(count, total, _Z)
+            summary[status] = {
+                "estimate": round(count / total, 4),
+                "low": round(low, 4),
+                "high": round(high, 4),
+            }
+        return {"sampled": total, "statuses": summary}
@@ -1,8 +1,15 @@
+import json
 import logging
 from typing import Optional
+from . import config
 from .parser import LogParser
 from .evaluator import SensorEvaluator
 from .output import OutputWriter
+from .checkpoint import CheckpointManager
+from .quarantine import QuarantineWriter
+from .drift import DriftDetector
+from .pipeline import AnalysisPipeline
+from .sampling import SampledPreview
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -12,18 +19,124 @@ logger = logging.getLogger(__name__)
 class SensorAnalysisService:
     def __init__(self, log_file: str):
         self.log_file = log_file
+        # Per-stage busy/idle times of the last pipelined run
+        self.stage_stats = {}
+
+    def run(
+        self,
+        output_file: Optional[str] = None,
+        checkpoint_every: Optional[int] = None,
+        resume: bool = False,
+        quarantine_file: Optional[str] = None,
+        quarantine_mode: str = "line",
+        drift_file: Optional[str] = None,
+        drift_window: Optional[int] = None,
+        pipelined: bool = False,
+        block_size: Optional[int] = None,
+        queue_depth: Optional[int] = None,
+    ):
+        # Bad lines go to the quarantine file instead of aborting the run
+        quarantine = (
+            QuarantineWriter(quarantine_file, quarantine_mode)
+            if quarantine_file
+            else None
+        )
 
-    def run(self, output_file: Optional[str] = None):
         # Step 1: Parse reference values from the log file
-        parser = LogParser(self.log_file)
+        parser = LogParser(self.log_file, quarantine)
         known_temperature, known_humidity, known_monoxide = parser.parse_reference()
 
-        # Step 2: Evaluate sensors using the parsed records
-        evaluator = SensorEvaluator()
-        results_iter = evaluator.evaluate(
-            known_temperature, known_humidity, known_monoxide, parser.parse_records()
+        # Optional single-pass stage reporting when sensors start drifting
+        drift = (
+            DriftDetector(
+                drift_file,
+                known_temperature,
+                known_humidity,
+                known_monoxide,
+                drift_window or config.DRIFT_WINDOW_SIZE,
+            )
+            if drift_file
+            else None
         )
 
-        # Step 3: Write the evaluation results
-        writer = OutputWriter()
-        writer.write_streaming_results(results_iter, output_file)
+        # Restore progress from the last checkpoint when resuming
+        checkpoint = None
+        resumed = None
+        if checkpoint_every or resume:
+            if pipelined:
+                # Stages run ahead of each other, so there is no single resume position
+                raise ValueError("Checkpointing is not supported in pipelined mode")
+            if not output_file:
+                raise ValueError("Checkpointing requires an output file")
+            checkpoint = CheckpointManager(
+                self.log_file,
+                output_file,
+                checkpoint_every or config.CHECKPOINT_EVERY_SENSORS,
+            )
+            checkpoint.attach(parser, drift)
+            if resume:
+                resumed = checkpoint.load()
+            else:
+                checkpoint.clear()
+
+        if quarantine:
+            quarantine.open(resumed.quarantine_offset if resumed else None)
+        if drift:
+            drift.open(resumed.drift_offset if resumed else None)
+        try:
+            # Step 2: Evaluate sensors using the parsed records
+            evaluator = SensorEvaluator()
+
+            def evaluate(records):
+                if drift:
+                    records = drift.track(records)
+                return evaluator.evaluate(
+                    known_temperature, known_humidity, known_monoxide, records
+                )
+
+            # Step 3: Write the evaluation results
+            writer = OutputWriter()
+            if pipelined:
+                # Read, evaluate and write concurrently, handing over batches
+                pipeline = AnalysisPipeline(
+                    config.PIPELINE_BLOCK_SIZE if block_size is None else block_size,
+                    config.PIPELINE_QUEUE_DEPTH if queue_depth is None else queue_depth,
+                )
+                self.stage_stats = pipeline.stats
+                pipeline.run(parser, evaluate, writer, output_file)
+            else:
+                records = (
+                    parser.parse_records(resumed.byte_offset, resumed.line_num)
+                    if resumed
+                    else parser.parse_records()
+                )
+                writer.write_streaming_results(
+                    evaluate(records), output_file, checkpoint
+                )
+        finally:
+            if quarantine:
+                quarantine.close()
+            if drift:
+                drift.close()
+
+    def preview(
+        self,
+        output_file: Optional[str] = None,
+        sample_size: Optional[int] = None,
+        margin: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> dict:
+        """Estimates the status distribution from a random sample of sensor blocks."""
+        sampler = SampledPreview(
+            self.log_file,
+            config.SAMPLE_SIZE if sample_size is None else sample_size,
+            margin,
+            seed,
+        )
+        report = sampler.run()
+        if output_file:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        else:
+            print(json.dumps(report, indent=2))
+        return report
@@ -0,0 +1,153 @@
+import unittest
+import tempfile
+import os
+import json
+from sensor_analysis.service import SensorAnalysisService
+
+
+class TestCheckpointResume(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "log.txt")
+        self.output_file = os.path.join(self.temp_dir.name, "results.json")
+        self.quarantine_file = os.path.join(self.temp_dir.name, "bad.jsonl")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_log(self, log_text: str):
+        with open(self.log_file, "w") as f:
+            f.write(log_text)
+
+    def test_resume_after_malformed_line(self):
+        log_text = """reference 70.0 45.0 6
+thermometer temp-1
+2025-04-28T22:00 70.2
+2025-04-28T22:01 69.8
+humidity hum-1
+2025-04-28T22:00 45.1
+monoxide mon-1
+2025-04-28T22:00 5
+garbage
+"""
+        self.write_log(log_text)
+        service = SensorAnalysisService(self.log_file)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, checkpoint_every=1)
+        # The checkpoint points at the last sensor block that was not finished
+        with open(self.output_file + ".ckpt", "r") as f:
+            checkpoint = json.load(f)
+        self.assertEqual(checkpoint["line_num"], 7)
+        self.assertEqual(checkpoint["results_written"], 2)
+
+        service.run(
+            self.output_file, resume=True, quarantine_file=self.quarantine_file
+        )
+        with open(self.output_file, "r") as f:
+            results = json.load(f)
+        self.assertEqual(
+            results, {"temp-1": "ultra precise", "hum-1": "keep", "mon-1": "keep"}
+        )
+        with open(self.quarantine_file, "r") as f:
+            quarantined = [json.loads(line) for line in f]
+        self.assertEqual(len(quarantined), 1)
+        self.assertEqual(quarantined[0]["line"], 9)
+        # Checkpoint files are removed once the run completes
+        self.assertFalse(os.path.exists(self.output_file + ".ckpt"))
+        self.assertFalse(os.path.exists(self.output_file + ".partial"))
+
+    def test_resume_keeps_drift_events(self):
+        log_text = """reference 70.0 45.0 6
+humidity hum-1
+2025-04-28T22:00 47.1
+2025-04-28T22:01 47.2
+humidity hum-2
+2025-04-28T22:00 42.1
+2025-04-28T22:01 42.2
+garbage
+"""
+        self.write_log(log_text)
+        drift_file = os.path.join(self.temp_dir.name, "drift.jsonl")
+        service = SensorAnalysisService(self.log_file)
+        with self.assertRaises(ValueError):
+            service.run(
+                self.output_file, checkpoint_every=1, drift_file=drift_file, drift_window=2
+            )
+        service.run(
+            self.output_file,
+            resume=True,
+            quarantine_file=self.quarantine_file,
+            drift_file=drift_file,
+            drift_window=2,
+        )
+        with open(drift_file, "r") as f:
+            sensors = [json.loads(line)["sensor"] for line in f]
+        self.assertEqual(sensors, ["hum-1", "hum-2"])
+
+    def crash_with_checkpoint(self):
+        log_text = """reference 70.0 45.0 6
+thermometer temp-1
+2025-04-28T22:00 70.2
+2025-04-28T22:01 69.8
+humidity hum-1
+2025-04-28T22:00 45.1
+garbage
+"""
+        self.write_log(log_text)
+        service = SensorAnalysisService(self.log_file)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, checkpoint_every=1)
+        self.assertTrue(os.path.exists(self.output_file + ".ckpt"))
+        return service
+
+    def test_fresh_run_discards_stale_checkpoint(self):
+        self.crash_with_checkpoint()
+        # Same lines reordered: same size, but the bad line comes before any result
+        log_text = """reference 70.0 45.0 6
+thermometer temp-1
+garbage
+2025-04-28T22:00 70.2
+2025-04-28T22:01 69.8
+humidity hum-1
+2025-04-28T22:00 45.1
+"""
+        self.write_log(log_text)
+        service = SensorAnalysisService(self.log_file)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, checkpoint_every=1)
+        self.assertFalse(os.path.exists(self.output_file + ".ckpt"))
+
+        service.run(
+            self.output_file, resume=True, quarantine_file=self.quarantine_file
+        )
+        with open(self.output_file, "r") as f:
+            results = json.load(f)
+        self.assertEqual(results, {"temp-1": "ultra precise", "hum-1": "keep"})
+
+    def test_resume_refuses_truncated_partial(self):
+        service = self.crash_with_checkpoint()
+        with open(self.output_file + ".partial", "w"):
+            pass
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, resume=True)
+
+    def test_resume_refuses_modified_log(self):
+        service = self.crash_with_checkpoint()
+        stat = os.stat(self.log_file)
+        os.utime(self.log_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, resume=True)
+
+    def test_resume_without_checkpoint_starts_over(self):
+        self.write_log("reference 70.0 45.0 6\nhumidity hum-1\n2025-04-28T22:00 45.1\n")
+        service = SensorAnalysisService(self.log_file)
+        service.run(self.output_file, resume=True)
+        with open(self.output_file, "r") as f:
+            results = json.load(f)
+        self.assertEqual(results, {"hum-1": "keep"})
+
+    def test_checkpoint_requires_output_file(self):
+        self.write_log("reference 70.0 45.0 6\n")
+        service = SensorAnalysisService(self.log_file)
+        with self.assertRaises(ValueError):
+            service.run(None, checkpoint_every=10)
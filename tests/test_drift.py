@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+import os
+import json
+from sensor_analysis.parser import SensorRecord
+from sensor_analysis.drift import DriftDetector
+
+
+class TestDriftDetector(unittest.TestCase):
+    def setUp(self):
+        self.temp_fd, self.temp_file = tempfile.mkstemp()
+        self.detector = DriftDetector(self.temp_file, 70.0, 45.0, 6, window_size=3)
+
+    def tearDown(self):
+        os.close(self.temp_fd)
+        os.remove(self.temp_file)
+
+    def run_detector(self, records):
+        self.detector.open()
+        passed = list(self.detector.track(iter(records)))
+        self.detector.close()
+        with open(self.temp_file, "r") as f:
+            events = [json.loads(line) for line in f]
+        return passed, events
+
+    def test_records_pass_through(self):
+        records = [
+            SensorRecord("humidity", "hum-1", "2025-04-28T22:00", 45.1),
+            SensorRecord("humidity", "hum-1", "2025-04-28T22:01", 45.2),
+        ]
+        passed, events = self.run_detector(records)
+        self.assertEqual(passed, records)
+        self.assertEqual(events, [])
+
+    def test_mean_leaves_band(self):
+        values = [45.0, 45.5, 46.0, 46.5, 47.0, 47.5]
+        records = [
+            SensorRecord("humidity", "hum-1", f"2025-04-28T22:0{i}", v)
+            for i, v in enumerate(values)
+        ]
+        _, events = self.run_detector(records)
+        # Rolling means: 45.5, 46.0, 46.5 (first one beyond 1.0), 47.0
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["sensor"], "hum-1")
+        self.assertEqual(events[0]["event"], "mean out of band")
+        self.assertEqual(events[0]["timestamp"], "2025-04-28T22:04")
+        self.assertAlmostEqual(events[0]["value"], 46.5)
+
+    def test_std_dev_exceeded(self):
+        values = [70.0, 70.0, 70.0, 62.0, 78.0]
+        records = [
+            SensorRecord("thermometer", "temp-1", f"2025-04-28T22:0{i}", v)
+            for i, v in enumerate(values)
+        ]
+        _, events = self.run_detector(records)
+        # [70, 70, 62] already pulls the mean out of band, [70, 62, 78] is too noisy
+        self.assertEqual(
+            [(e["event"], e["timestamp"]) for e in events],
+            [
+                ("mean out of band", "2025-04-28T22:03"),
+                ("std dev exceeded", "2025-04-28T22:04"),
+            ],
+        )
+        self.assertAlmostEqual(events[1]["value"], 8.0)
+
+    def test_window_resets_per_sensor(self):
+        records = [
+            SensorRecord("monoxide", "mon-1", "2025-04-28T22:00", 20),
+            SensorRecord("monoxide", "mon-1", "2025-04-28T22:01", 20),
+            SensorRecord("monoxide", "mon-2", "2025-04-28T22:00", 6),
+            SensorRecord("monoxide", "mon-2", "2025-04-28T22:01", 6),
+            SensorRecord("monoxide", "mon-2", "2025-04-28T22:02", 6),
+        ]
+        _, events = self.run_detector(records)
+        self.assertEqual(events, [])
@@ -2,6 +2,7 @@ import unittest
 import tempfile
 import os
 from sensor_analysis.parser import LogParser, SensorRecord
+from sensor_analysis.quarantine import QuarantineWriter
 
 
 class TestLogParser(unittest.TestCase):
@@ -65,3 +66,45 @@ monoxide mon-1
         self.write_log(log_text)
         records = list(self.parser.parse_records())
         self.assertEqual(records, [])
+
+    def test_quarantine_bad_line(self):
+        log_text = """reference 70.0 45.0 6
+humidity hum-1
+2025-04-28T22:00 45.1
+2025-04-28T22:01 oops
+2025-04-28T22:02 45.3
+"""
+        self.write_log(log_text)
+        quarantine_file = self.temp_file + ".bad"
+        quarantine = QuarantineWriter(quarantine_file, "line")
+        quarantine.open()
+        parser = LogParser(self.temp_file, quarantine)
+        records = list(parser.parse_records())
+        quarantine.close()
+        self.assertEqual([r.value for r in records], [45.1, 45.3])
+        with open(quarantine_file, "r") as f:
+            lines = f.readlines()
+        os.remove(quarantine_file)
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"line": 4', lines[0])
+
+    def test_quarantine_bad_block(self):
+        log_text = """reference 70.0 45.0 6
+humidity hum-1
+2025-04-28T22:00 45.1
+2025-04-28T22:01 oops
+monoxide mon-1
+2025-04-28T22:00 5
+"""
+        self.write_log(log_text)
+        quarantine_file = self.temp_file + ".bad"
+        quarantine = QuarantineWriter(quarantine_file, "block")
+        quarantine.open()
+        parser = LogParser(self.temp_file, quarantine)
+        records = list(parser.parse_records())
+        quarantine.close()
+        self.assertEqual([r.sensor_name for r in records], ["mon-1"])
+        with open(quarantine_file, "r") as f:
+            lines = f.readlines()
+        os.remove(quarantine_file)
+        self.assertEqual(len(lines), 3)
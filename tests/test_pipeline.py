@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+import os
+import json
+from sensor_analysis.service import SensorAnalysisService
+
+LOG_TEXT = """reference 70.0 45.0 6
+thermometer temp-1
+2025-04-28T22:00 70.2
+2025-04-28T22:01 69.8
+thermometer temp-2
+2025-04-28T22:00 65.0
+2025-04-28T22:01 75.0
+humidity hum-1
+2025-04-28T22:00 45.1
+monoxide mon-1
+2025-04-28T22:00 5
+"""
+
+
+class TestPipelinedService(unittest.TestCase):
+    def setUp(self):
+        self.temp_fd, self.temp_file = tempfile.mkstemp()
+        self.output_fd, self.output_file = tempfile.mkstemp()
+
+    def tearDown(self):
+        os.close(self.temp_fd)
+        os.remove(self.temp_file)
+        os.close(self.output_fd)
+        os.remove(self.output_file)
+
+    def write_log(self, log_text: str):
+        with open(self.temp_file, "w") as f:
+            f.write(log_text)
+
+    def test_pipelined_matches_sequential(self):
+        self.write_log(LOG_TEXT)
+        service = SensorAnalysisService(self.temp_file)
+        # Tiny blocks force lines to be split across block reads
+        service.run(self.output_file, pipelined=True, block_size=7, queue_depth=1)
+        with open(self.output_file, "r") as f:
+            results = json.load(f)
+        self.assertEqual(
+            results,
+            {
+                "temp-1": "ultra precise",
+                "temp-2": "precise",
+                "hum-1": "keep",
+                "mon-1": "keep",
+            },
+        )
+        self.assertEqual(
+            set(service.stage_stats), {"reader", "evaluator", "writer"}
+        )
+        self.assertGreater(service.stage_stats["reader"].batches, 1)
+
+    def test_pipelined_error_is_raised(self):
+        self.write_log(LOG_TEXT + "garbage\n")
+        service = SensorAnalysisService(self.temp_file)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, pipelined=True)
+
+    def test_pipelined_rejects_checkpointing(self):
+        self.write_log(LOG_TEXT)
+        service = SensorAnalysisService(self.temp_file)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, pipelined=True, checkpoint_every=10)
+
+    def test_pipelined_rejects_invalid_sizes(self):
+        self.write_log(LOG_TEXT)
+        service = SensorAnalysisService(self.temp_file)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, pipelined=True, block_size=0)
+        with self.assertRaises(ValueError):
+            service.run(self.output_file, pipelined=True, queue_depth=0)
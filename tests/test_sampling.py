@@ -0,0 +1,87 @@
+import unittest
+import tempfile
+import os
+from sensor_analysis.sampling import SampledPreview, wilson_interval
+
+
+class TestSampledPreview(unittest.TestCase):
+    def setUp(self):
+        self.temp_fd, self.temp_file = tempfile.mkstemp()
+
+    def tearDown(self):
+        os.close(self.temp_fd)
+        os.remove(self.temp_file)
+
+    def write_log(self, log_text: str):
+        with open(self.temp_file, "w") as f:
+            f.write(log_text)
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100, 1.96)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        low, high = wilson_interval(0, 10, 1.96)
+        self.assertEqual(low, 0.0)
+        self.assertGreater(high, 0.0)
+
+    def test_sample_humidity_statuses(self):
+        # Alternate good and bad humidity sensors
+        lines = ["reference 70.0 45.0 6"]
+        for i in range(200):
+            lines.append(f"humidity hum-{i}")
+            value = 45.1 if i % 2 else 49.0
+            lines.append(f"2025-04-28T22:00 {value}")
+            lines.append(f"2025-04-28T22:01 {value}")
+        self.write_log("\n".join(lines) + "\n")
+
+        report = SampledPreview(self.temp_file, sample_size=100, seed=1).run()
+        self.assertEqual(report["sensors_sampled"], 100)
+        statuses = report["sensor_types"]["humidity"]["statuses"]
+        self.assertEqual(set(statuses), {"keep", "discard"})
+        for status in statuses.values():
+            self.assertLessEqual(status["low"], 0.5)
+            self.assertGreaterEqual(status["high"], 0.5)
+
+    def test_malformed_blocks_are_skipped(self):
+        log_text = """reference 70.0 45.0 6
+monoxide mon-1
+2025-04-28T22:00 5
+monoxide mon-2
+2025-04-28T22:00 oops
+monoxide mon-3
+2025-04-28T22:00 6
+"""
+        self.write_log(log_text)
+        report = SampledPreview(self.temp_file, sample_size=10, seed=3).run()
+        # Only three sensors exist, so sampling stops once all of them are seen
+        self.assertEqual(report["sensors_sampled"], 2)
+        self.assertEqual(report["blocks_skipped"], 1)
+        monoxide = report["sensor_types"]["monoxide"]
+        self.assertEqual(monoxide["sampled"], 2)
+        self.assertEqual(list(monoxide["statuses"]), ["keep"])
+
+    def test_single_sensor_log(self):
+        self.write_log("reference 70.0 45.0 6\nhumidity hum-1\n2025-04-28T22:00 45.1\n")
+        for seed in range(5):
+            report = SampledPreview(self.temp_file, sample_size=5, seed=seed).run()
+            self.assertEqual(report["sensors_sampled"], 1)
+            self.assertEqual(report["sensor_types"]["humidity"]["sampled"], 1)
+            self.assertLessEqual(report["fraction_read"], 1.0)
+
+    def test_first_block_is_sampled(self):
+        log_text = """reference 70.0 45.0 6
+monoxide mon-1
+2025-04-28T22:00 5
+monoxide mon-2
+2025-04-28T22:00 20
+"""
+        self.write_log(log_text)
+        for seed in range(5):
+            report = SampledPreview(self.temp_file, sample_size=1, seed=seed).run()
+            self.assertEqual(report["sensors_sampled"], 1)
+        # Exhaustive probing sees both blocks whatever the seed
+        for seed in range(5):
+            report = SampledPreview(self.temp_file, sample_size=5, seed=seed).run()
+            statuses = report["sensor_types"]["monoxide"]["statuses"]
+            self.assertEqual(statuses["keep"]["estimate"], 0.5)
+            self.assertEqual(statuses["discard"]["estimate"], 0.5)
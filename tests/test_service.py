@@ -47,3 +47,29 @@ monoxide mon-1
         with open(self.output_file, "r") as f:
             results = json.load(f)
         self.assertEqual(results, {})
+
+    def test_service_preview(self):
+        log_text = """reference 70.0 45.0 6
+thermometer temp-1
+2025-04-28T22:00 70.2
+2025-04-28T22:01 69.8
+humidity hum-1
+2025-04-28T22:00 45.1
+"""
+        self.write_log(log_text)
+        service = SensorAnalysisService(self.temp_file)
+        # More samples than sensors, so probing stops once both blocks are seen
+        service.preview(self.output_file, sample_size=5, seed=0)
+        with open(self.output_file, "r") as f:
+            report = json.load(f)
+        self.assertEqual(report["sensors_sampled"], 2)
+        self.assertLessEqual(report["fraction_read"], 1.0)
+        self.assertEqual(
+            report["sensor_types"]["thermometer"]["statuses"]["ultra precise"][
+                "estimate"
+            ],
+            1.0,
+        )
+        self.assertEqual(
+            report["sensor_types"]["humidity"]["statuses"]["keep"]["estimate"], 1.0
+        )